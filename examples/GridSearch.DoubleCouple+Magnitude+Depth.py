@@ -179,11 +179,9 @@ if __name__=='__main__':
         greens_sw = None
 
 
-    stations = comm.bcast(stations, root=0)
-    data_bw = comm.bcast(data_bw, root=0)
-    data_sw = comm.bcast(data_sw, root=0)
-    greens_bw = comm.bcast(greens_bw, root=0)
-    greens_sw = comm.bcast(greens_sw, root=0)
+    # a single collective call rather than one per object
+    stations, data_bw, data_sw, greens_bw, greens_sw = comm.bcast(
+        (stations, data_bw, data_sw, greens_bw, greens_sw), root=0)
 
 
     #
@@ -231,6 +229,6 @@ if __name__=='__main__':
             stations, best_origin, best_source, lune_dict)
 
         plot_misfit_depth(event_id+'_misfit_depth.png',
-            results, origins, grid, title='event_id')
+            results, origins, grid, title=event_id)
 
         print('\nFinished\n')
@@ -72,8 +72,7 @@ def gmt_plot_misfit_force(filename, phi, h, values, colormap='panoply', **kwargs
     if _nothing_to_plot(values):
         return
 
-    lat = np.degrees(np.pi/2 - np.arccos(h))
-    lon = wrap_180(phi + 90.)
+    lon, lat = _to_lonlat(phi, h)
 
     lon, lat =  _parse_lonlat(lon,lat)
     values, minval, maxval, exp = _parse_values(values)
@@ -94,8 +93,7 @@ def gmt_plot_likelihood_force(filename, phi, h, values, colormap='hot', **kwargs
     if _nothing_to_plot(values):
         return
 
-    lat = np.degrees(np.pi/2 - np.arccos(h))
-    lon = wrap_180(phi + 90.)
+    lon, lat = _to_lonlat(phi, h)
 
     lon, lat =  _parse_lonlat(lon,lat)
     values, minval, maxval, exp = _parse_values(values)
@@ -122,7 +120,7 @@ def _call(shell_script, filename, lon, lat, values,
     title, subtitle = _parse_title(title)
 
     # write lon,lat,val ASCII table
-    ascii_data = 'tmp_'+filename+'.txt'
+    ascii_data = 'tmp_%s.txt' % filename
     _savetxt(ascii_data, lon, lat, values)
 
     cpt_local = fullpath('mtuq/graphics/_gmt/cpt', cpt_name+'.cpt')
@@ -169,9 +167,9 @@ def _nothing_to_plot(values):
             Warning)
         return True
 
-    masked = np.ma.array(values, mask=mask)
-    minval = masked.min()
-    maxval = masked.max()
+    # NaN-aware reductions avoid constructing a masked copy of the values
+    minval = np.nanmin(values)
+    maxval = np.nanmax(values)
 
     if minval==maxval:
         warn(
@@ -180,6 +178,22 @@ def _nothing_to_plot(values):
         return True
 
 
+def _to_lonlat(phi, h):
+    """ Converts force orientation parameters to longitude and latitude
+    """
+    # operations are carried out in place, so that only the two output
+    # arrays are allocated
+    lat = np.empty(np.shape(h))
+    np.arccos(np.asarray(h, dtype=float), out=lat)
+    np.subtract(np.pi/2, lat, out=lat)
+    np.degrees(lat, out=lat)
+
+    lon = np.add(np.asarray(phi, dtype=float), 90.)
+    lon = wrap_180(lon)
+
+    return lon, lat
+
+
 def _parse_lonlat(lon, lat):
 
     lon, lat = np.meshgrid(lon, lat)
@@ -189,11 +189,15 @@ axis_label_kwargs = {
 
 
 def _pcolor(axis, x, y, values, cmap, **kwargs):
+    # pcolormesh draws a single rasterized QuadMesh rather than one vector
+    # polygon per grid cell, which is much faster for dense grids
+    kwargs.setdefault('rasterized', True)
+
     # workaround matplotlib compatibility issue
     try:
-        axis.pcolor(x, y, values, cmap=cmap, shading='auto',  **kwargs)
+        axis.pcolormesh(x, y, values, cmap=cmap, shading='auto',  **kwargs)
     except:
-        axis.pcolor(x, y, values, cmap=cmap, **kwargs)
+        axis.pcolormesh(x, y, values, cmap=cmap, **kwargs)
 
 
 kappa_ticks = [0, 45, 90, 135, 180, 225, 270, 315, 360]
@@ -38,7 +38,6 @@ def plot_misfit_force(filename, ds, misfit_callback=None, title='',
 
     """
     _check(ds)
-    ds = ds.copy()
 
     if issubclass(type(ds), DataArray):
         ds = ds.min(dim=('origin_idx', 'F0'))
@@ -206,13 +205,16 @@ def _bin(df, handle, npts_phi=60, npts_h=30):
     phi = closed_interval(0., 360, npts_phi+1)
     h = closed_interval(-1., +1., npts_h+1)
 
+    # which grid points lie within each column and row of cells? (computed
+    # once, rather than rescanning the whole DataFrame for every cell)
+    in_phi = [df['phi'].between(phi[_j], phi[_j+1]) for _j in range(npts_phi)]
+    in_h = [df['h'].between(h[_i], h[_i+1]) for _i in range(npts_h)]
+
     binned = np.empty((npts_h, npts_phi))
     for _i in range(npts_h):
         for _j in range(npts_phi):
             # which grid points lie within cell (i,j)?
-            subset = df.loc[
-                df['phi'].between(phi[_j], phi[_j+1]) &
-                df['h'].between(h[_i], h[_i+1])]
+            subset = df.loc[in_phi[_j] & in_h[_i]]
 
             if len(subset)==0:
                 print("Encountered empty bin\n"
@@ -40,7 +40,6 @@ def plot_misfit_lune(filename, ds, misfit_callback=None, title='',
 
     """
     _check(ds)
-    ds = ds.copy()
 
     if issubclass(type(ds), DataArray):
         ds = ds.min(dim=('origin_idx', 'rho', 'kappa', 'sigma', 'h'))
@@ -82,7 +81,6 @@ def plot_misfit_mt_lune(filename, ds, misfit_callback=None, title='',
 
     """
     _check(ds)
-    ds = ds.copy()
     ds_for_plotting = ds.copy()
 
     if issubclass(type(ds), DataArray):
@@ -256,30 +254,34 @@ def _bin(df, handle, npts_v=20, npts_w=40, tightness=0.6, normalize=False):
     # what cell edges correspond to the above centers?
     centers_gamma = to_gamma(centers_v)
     edges_gamma = np.array(centers_gamma[:-1] + centers_gamma[1:])/2.
-    edges_v = to_v(edges_gamma)
 
     centers_delta = to_delta(centers_w)
     edges_delta = np.array(centers_delta[:-1] + centers_delta[1:])/2.
-    edges_w = to_w(edges_delta)
 
-    edges_v = np.pad(edges_v, 1)
+    # fill preallocated arrays, rather than converting and then padding
+    edges_v = np.empty(npts_v+1)
+    edges_v[1:-1] = to_v(edges_gamma)
     edges_v[0] = -1./3.
     edges_v[-1] = +1./3.
 
-    edges_w = np.pad(edges_w, 1)
+    edges_w = np.empty(npts_w+1)
+    edges_w[1:-1] = to_w(edges_delta)
     edges_w[0] = -3.*np.pi/8.
     edges_w[-1] = +3.*np.pi/8
 
 
+    # which grid points lie within each column and row of cells? (computed
+    # once, rather than rescanning the whole DataFrame for every cell)
+    in_v = [df['v'].between(edges_v[_j], edges_v[_j+1]) for _j in range(npts_v)]
+    in_w = [df['w'].between(edges_w[_i], edges_w[_i+1]) for _i in range(npts_w)]
+
     # bin grid points into cells
     binned = np.empty((npts_w, npts_v))
     binned[:] = np.nan
     for _i in range(npts_w):
         for _j in range(npts_v):
             # which grid points lie within cell (i,j)?
-            subset = df.loc[
-                df['v'].between(edges_v[_j], edges_v[_j+1]) &
-                df['w'].between(edges_w[_i], edges_w[_i+1])]
+            subset = df.loc[in_v[_j] & in_w[_i]]
 
             if len(subset)==0:
                 print("Encountered empty bin")
@@ -308,7 +310,8 @@ def _write_gmt_mt_params(filename, ds_for_plotting, misfit_values):
     id = 0
     for iv in range(len(ds_for_plotting.coords['v'])):
         for iw in range(len(ds_for_plotting.coords['w'])):
-            idx = np.unravel_index(np.argmin(ds_for_plotting[:,iv,iw,:,:,:,0].values, axis=None), np.shape(ds_for_plotting[:,iv,iw,:,:,:,0]))
+            sliced = ds_for_plotting[:,iv,iw,:,:,:,0].values
+            idx = np.unravel_index(np.argmin(sliced, axis=None), sliced.shape)
             best_orientation[id, 0] = to_gamma(ds_for_plotting.coords['v'][iv])
             best_orientation[id, 1] = to_delta(ds_for_plotting.coords['w'][iw])
             best_orientation[id, 2] = normalized_values[id]
@@ -344,6 +347,7 @@ def _extract_magnitude_map(ds):
     best_magnitude_map=np.empty((nv,nw))
     for iv in range(len(ds.coords['v'])):
         for iw in range(len(ds.coords['w'])):
-            magnitude_idx = np.unravel_index(np.argmin(ds[:,iv,iw,:,:,:,0].values, axis=None), np.shape(ds[:,iv,iw,:,:,:,0]))[0]
+            sliced = ds[:,iv,iw,:,:,:,0].values
+            magnitude_idx = np.unravel_index(np.argmin(sliced, axis=None), sliced.shape)[0]
             best_magnitude_map[iv, iw] = to_Mw(ds['rho'][magnitude_idx].values) - M0
     return(best_magnitude_map.T)
@@ -231,13 +231,13 @@ def _plot_mt_xy_gmt(filename, x, y, sources, title='',
 
 
     if mt_array is not None:
-        mt_file = 'tmp_mt_'+filename+'.txt'
+        mt_file = 'tmp_mt_%s.txt' % filename
         np.savetxt(mt_file, mt_array)
     else:
         mt_file = "''"
 
     if mw_array is not None:
-        mw_file = 'tmp_mw_'+filename+'.txt'
+        mw_file = 'tmp_mw_%s.txt' % filename
         np.savetxt(mw_file, mw_array)
     else:
         mw_file = "''"
@@ -50,7 +50,6 @@ def plot_misfit_vw(filename, ds, misfit_callback=None, title=''):
 
     """
     _check(ds)
-    ds = ds.copy()
 
     if issubclass(type(ds), DataArray):
         ds = ds.min(dim=('origin_idx', 'rho', 'kappa', 'sigma', 'h'))
@@ -216,8 +215,10 @@ def _plot_vw(v, w, values, colorbar_type=0, cmap='hot_r', title=None):
     corners_v = _centers_to_edges(v)
     corners_w = _centers_to_edges(w)
 
-    # `values` gets mapped to pixel colors
-    pyplot.pcolor(corners_v, corners_w, values, cmap=cmap)
+    # `values` gets mapped to pixel colors (pcolormesh draws a single
+    # rasterized mesh rather than one vector polygon per pixel)
+    pyplot.pcolormesh(corners_v, corners_w, values, cmap=cmap,
+        rasterized=True)
 
     # v and w have the following bounds
     # (see https://doi.org/10.1093/gji/ggv262)
@@ -261,13 +262,16 @@ def _bin(df, handle, npts_v=20, npts_w=40):
     v = closed_interval(-1./3., 1./3., npts_v+1)
     w = closed_interval(-3./8.*np.pi, 3./8.*np.pi, npts_w+1)
 
+    # which grid points lie within each column and row of cells? (computed
+    # once, rather than rescanning the whole DataFrame for every cell)
+    in_v = [df['v'].between(v[_j], v[_j+1]) for _j in range(npts_v)]
+    in_w = [df['w'].between(w[_i], w[_i+1]) for _i in range(npts_w)]
+
     binned = np.empty((npts_w, npts_v))
     for _i in range(npts_w):
         for _j in range(npts_v):
             # which grid points lie within cell (i,j)?
-            subset = df.loc[
-                df['v'].between(v[_j], v[_j+1]) &
-                df['w'].between(w[_i], w[_i+1])]
+            subset = df.loc[in_v[_j] & in_w[_i]]
 
             binned[_i, _j] = handle(subset[0])
 
@@ -276,16 +280,16 @@ def _bin(df, handle, npts_v=20, npts_w=40):
 
 def _centers_to_edges(v):
     if issubclass(type(v), DataArray):
-        v = v.values.copy()
-    else:
-        v = v.copy()
+        v = v.values
 
     dv = (v[1]-v[0])
-    v -= dv/2
-    v = np.pad(v, (0, 1))
-    v[-1] = v[-2] + dv
 
-    return v
+    # fill preallocated output in place, rather than copying and then padding
+    edges = np.empty(len(v)+1)
+    np.subtract(v, dv/2, out=edges[:-1])
+    edges[-1] = edges[-2] + dv
+
+    return edges
 
 
 def _local_path(name):
@@ -7,6 +7,7 @@ from mtuq.event import Origin
 from mtuq.station import Station
 from mtuq.dataset import Dataset
 from mtuq.util.signal import check_time_sampling
+from mtuq.wavelet import Wavelet
 from obspy.core import Stream, Trace
 from obspy.geodetics import gps2dist_azimuth
 from scipy.signal import fftconvolve
@@ -211,8 +212,7 @@ class GreensTensor(Stream):
         Source wavelet
 
         """
-        for trace in self:
-            wavelet.convolve(trace)
+        _convolve(self, wavelet, {})
 
 
     def select(self, component=None, channel=None):
@@ -362,8 +362,15 @@ class GreensTensorList(list):
         Source wavelet
 
         """
+        # the discretized wavelet is shared among tensors for the duration of
+        # this call only, in case the wavelet is modified afterwards
+        cache = {}
+
         for tensor in self:
-            tensor.convolve(wavelet)
+            if type(tensor).convolve is GreensTensor.convolve:
+                _convolve(tensor, wavelet, cache)
+            else:
+                tensor.convolve(wavelet)
 
 
     def tag_add(self, tag):
@@ -420,3 +427,23 @@ class GreensTensorList(list):
         return new_ds
 
 
+#
+# utility functions
+#
+
+def _convolve(traces, wavelet, cache):
+    """ Convolves traces with given wavelet
+
+    For wavelets that use the default ``Wavelet.convolve``, the discretized
+    wavelet is stored in the given cache and reused for traces with the
+    same time sampling; anything else is convolved trace by trace
+    """
+    if isinstance(wavelet, Wavelet) and \
+       type(wavelet).convolve is Wavelet.convolve:
+        for trace in traces:
+            trace.data = wavelet._convolve_array(
+                trace.data, trace.stats.delta, _cache=cache)
+    else:
+        for trace in traces:
+            wavelet.convolve(trace)
+
@@ -3,12 +3,10 @@ import numpy as np
 import pandas
 import xarray
 
-from collections.abc import Iterable
 from mtuq.event import Origin
 from mtuq.grid import Grid, UnstructuredGrid
-from mtuq.util import iterable, timer, remove_list, warn, ProgressCallback,\
-    dataarray_idxmin, dataarray_idxmax
-from os.path import splitext
+from mtuq.util import iterable, timer, ProgressCallback,\
+    dataarray_idxmin, dataarray_idxmax, is_mpi_env
 from xarray.core.formatting import unindexed_dims_repr
 
 
@@ -84,7 +82,7 @@ def grid_search(data, greens, misfit, origins, sources,
         raise TypeError
 
     _subset = None
-    if _is_mpi_env():
+    if is_mpi_env():
         from mpi4py import MPI
         comm = MPI.COMM_WORLD
         iproc, nproc = comm.rank, comm.size
@@ -107,11 +105,9 @@ def grid_search(data, greens, misfit, origins, sources,
         data, greens, misfit, origins, _subset or sources, timed=timed, 
         msg_interval=msg_interval)
 
-    if _is_mpi_env() and gather:
-        values = comm.gather(values, root=0)
-        if iproc == 0:
-            values = np.concatenate(values, axis=0)
-        else:
+    if is_mpi_env() and gather:
+        values = _gather(comm, values, root=0)
+        if iproc != 0:
             return
 
     # convert from NumPy array to DataArray or DataFrame
@@ -288,21 +284,29 @@ class MTUQDataFrame(pandas.DataFrame):
 # utility functions
 #
 
-def _is_mpi_env():
-    try:
-        import mpi4py
-    except ImportError:
-        return False
+def _gather(comm, values, root=0):
+    """ Gathers misfit values from all processes
 
-    try:
-        import mpi4py.MPI
-    except ImportError:
-        return False
+    Uses MPI buffer communication to receive each process's values directly
+    into a preallocated array on the root process, rather than pickling them
+    and concatenating afterwards
+    """
+    from mpi4py import MPI
 
-    if mpi4py.MPI.COMM_WORLD.Get_size()>1:
-        return True
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    counts = comm.gather(values.size, root=root)
+
+    if comm.rank == root:
+        nrows = sum(counts)//values.shape[1]
+        gathered = np.empty((nrows, values.shape[1]), dtype=np.float64)
+        recvbuf = [gathered, counts, MPI.DOUBLE]
     else:
-        return False
+        gathered = None
+        recvbuf = None
+
+    comm.Gatherv(values, recvbuf, root=root)
+
+    return gathered
 
 
 def _to_dataarray(origins, sources, values):
@@ -91,7 +91,7 @@ class Client(ClientBase):
             prefix = station.id
             for suffix in SUFFIXES:
                 trace = obspy.read(
-                    self.path+'/'+prefix+'.'+suffix+'.sac', format='sac')[0]
+                    '%s/%s.%s.sac' % (self.path, prefix, suffix), format='sac')[0]
                 trace.component = suffix
                 stream += trace
 
@@ -2,14 +2,15 @@
 import obspy
 import numpy as np
 
+from concurrent.futures import ThreadPoolExecutor
 from obspy.core import Stream
 from mtuq.greens_tensor.syngine import GreensTensor 
 from mtuq.io.clients.base import Client as ClientBase
 from mtuq.util.signal import resample
 from mtuq.util.syngine import download_greens_tensor, download_force_response,\
-     resolve_model,\
+     get_greens_tensor_url, resolve_model,\
      GREENS_TENSOR_FILENAMES, SYNTHETICS_FILENAMES
-from mtuq.util import unzip
+from mtuq.util import iterable, unzip
 
 
 
@@ -71,9 +72,29 @@ class Client(ClientBase):
         ``verbose`` (`bool`)
 
         """
+        if self.include_mt:
+            self._download_greens_tensors(stations, origins)
+
         return super(Client, self).get_greens_tensors(stations, origins, verbose)
 
 
+    def _download_greens_tensors(self, stations, origins, max_workers=4):
+        """ Populates download cache for all (station, origin) pairs
+
+        Downloads are bound by web service latency rather than local CPU, so
+        they are carried out concurrently, once per distinct URL
+        """
+        pairs = {}
+        for origin in iterable(origins):
+            for station in iterable(stations):
+                pairs.setdefault(get_greens_tensor_url(
+                    self.url, self.model, station, origin), (station, origin))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda args: download_greens_tensor(
+                self.url, self.model, *args), pairs.values()))
+
+
     def _get_greens_tensor(self, station=None, origin=None):
         stream = Stream()
 
@@ -6,7 +6,7 @@ See ``mtuq/misfit/__init__.py`` for more information
 
 import numpy as np
 
-from mtuq.util.math import isclose, list_intersect_with_indices
+from mtuq.util.math import list_intersect_with_indices
 from mtuq.util.signal import get_components
 
 
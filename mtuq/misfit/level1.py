@@ -5,7 +5,7 @@ See ``mtuq/misfit/__init__.py`` for more information
 """
 
 import numpy as np
-from mtuq.util.math import correlate, isclose, list_intersect_with_indices
+from mtuq.util.math import correlate, list_intersect_with_indices
 from mtuq.util.signal import get_components, get_time_sampling
 
 
@@ -18,6 +18,8 @@ def misfit(data, greens, sources, norm, time_shift_groups,
     See ``mtuq/misfit/__init__.py`` for more information
     """
     helpers = []
+    time_sampling = []
+    group_indices = []
     values = np.zeros((len(sources), 1))
 
     #
@@ -28,6 +30,19 @@ def misfit(data, greens, sources, norm, time_shift_groups,
         helpers += [Helper(data[_j], greens[_j], norm, 
                            time_shift_min, time_shift_max)]
 
+        # time sampling scheme and time shift groups do not vary from one
+        # source to the next, so we determine them once per station
+        components = greens[_j].components
+        time_sampling += [get_time_sampling(d)]
+        group_indices += [[]]
+        if not components:
+            continue
+
+        for group in time_shift_groups:
+            _, indices = list_intersect_with_indices(
+                components, group)
+            group_indices[_j] += [indices]
+
     #
     # iterate over sources
     #
@@ -46,18 +61,13 @@ def misfit(data, greens, sources, norm, time_shift_groups,
                 continue
 
             # time sampling scheme
-            npts, dt = get_time_sampling(d)
-            padding_left = int(+time_shift_max/dt)
-            padding_right = int(-time_shift_min/dt)
+            npts, dt = time_sampling[_j]
 
 
-            for group in time_shift_groups:
+            for indices in group_indices[_j]:
                 # Finds the time-shift between data and synthetics that yields
                 # the maximum cross-correlation value across all components in 
                 # a given group, subject to min/max constraints
-                _, indices = list_intersect_with_indices(
-                    components, group)
-
                 ic = helpers[_j].get_time_shift(source, indices)
 
                 for _k in indices:
@@ -106,7 +116,6 @@ class Helper(object):
         misfit += self.d_d[index]
 
         # s^2 contribution
-        _  = np.dot(self.g_g[index, it, :, :], source)
         misfit += np.dot(np.dot(self.g_g[index, it, :, :], source), source)
 
         # -2sd contribution
@@ -6,7 +6,6 @@ See ``mtuq/misfit/__init__.py`` for more information
 
 import numpy as np
 import time
-from copy import deepcopy
 from mtuq.misfit.level1 import correlate
 from mtuq.util.math import to_mij, to_rtp
 from mtuq.util.signal import get_components, get_time_sampling
@@ -72,7 +71,8 @@ def misfit(data, greens, sources, norm, time_shift_groups,
     # call C extension
     #
 
-    start_time = time.time()
+    if debug_level > 0:
+      start_time = time.time()
 
     if norm in ['L2', 'hybrid']:
         results = c_ext_L2.misfit(
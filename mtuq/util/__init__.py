@@ -7,7 +7,6 @@ import copy
 import csv
 import time
 import numpy as np
-import obspy
 import re
 import uuid
 import warnings
@@ -20,8 +19,32 @@ except ImportError:
     from urllib.request import URLopener
 
 
-class AttribDict(obspy.core.util.attribdict.AttribDict):
-    pass
+class AttribDict(dict):
+    """ Dictionary whose items can also be accessed as attributes
+
+    Unlike ``obspy.core.util.AttribDict``, item access goes directly through
+    the built-in dictionary, so no extra Python-level lookup is incurred
+    """
+    __slots__ = ()
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+    def __delattr__(self, key):
+        try:
+            del self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def copy(self):
+        # as for obspy.core.util.AttribDict, returns a deep copy
+        return type(self)(copy.deepcopy(dict(self)))
 
 
 def asarray(x):
@@ -30,29 +53,37 @@ def asarray(x):
     return np.array(x, dtype=np.float64, ndmin=1, copy=False)
 
 
+_is_mpi = None
+
 def is_mpi_env():
-    try:
-        import mpi4py
-    except ImportError:
-        return False
+    """ Returns True if running under MPI with more than one process
+
+    The result cannot change during the lifetime of a process, so it is
+    determined on the first call and cached
+    """
+    global _is_mpi
+    if _is_mpi is not None:
+        return _is_mpi
 
     try:
         import mpi4py.MPI
     except ImportError:
-        return False
+        _is_mpi = False
+        return _is_mpi
 
-    if mpi4py.MPI.COMM_WORLD.Get_size()>1:
-        return True
-    else:
-        return False
+    _is_mpi = mpi4py.MPI.COMM_WORLD.Get_size()>1
+    return _is_mpi
 
 
 def iterable(arg):
-    """ Simple list typecast
+    """ Simple tuple typecast
+
+    Lists, tuples and grids are returned unchanged; anything else is wrapped
+    in a one-element tuple, which is cheaper to create than a list
     """
     from mtuq.grid import Grid, UnstructuredGrid
     if not isinstance(arg, (list, tuple, Grid, UnstructuredGrid)):
-        return [arg]
+        return (arg,)
     else:
         return arg
 
@@ -68,32 +99,31 @@ def remove_list(list1, list2):
     return list1
 
 
+_patterns = {}
+_metacharacters = set('.^$*+?{}[]\\|()')
+
 def replace(string, *args):
+    """ Applies regex substitutions given as (pattern, repl) pairs
+    """
     narg = len(args)
 
     iarg = 0
     while iarg < narg:
-        string = re.sub(args[iarg], args[iarg+1], string)
-        iarg += 2
-    return string
-
-
-def timer(func):
-    """ Decorator for measuring execution time; prints elapsed time to
-        standard output
-    """
-    def timed_func(*args, **kwargs):
-        start_time = time.time()
-
-        output = func(*args, **kwargs)
+        old, new = args[iarg], args[iarg+1]
 
-        if kwargs.get('verbose', True):
-            _elapsed_time = time.time() - start_time
-            print('  Elapsed time (s): %f\n' % _elapsed_time)
+        if not _metacharacters.intersection(old) and '\\' not in new:
+            # plain text substitution, no need for regex machinery
+            string = string.replace(old, new)
 
-        return output
+        else:
+            # compiled patterns are reused across calls
+            pattern = _patterns.get(old)
+            if pattern is None:
+                pattern = _patterns[old] = re.compile(old)
+            string = pattern.sub(new, string)
 
-    return timed_func
+        iarg += 2
+    return string
 
 
 def basepath():
@@ -114,9 +144,9 @@ def timer(func):
     """
     def timed_func(*args, **kwargs):
         if kwargs.get('timed', True):
-            start_time = time.time()
+            start_time = time.perf_counter()
             output = func(*args, **kwargs)
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             print('  Elapsed time (s): %f\n' % elapsed_time)
             return output
         else:
@@ -107,7 +107,6 @@ def to_mij(rho, v, w, kappa, sigma, h):
     m0 = rho/np.sqrt(2.)
 
     delta, gamma = to_delta_gamma(v, w)
-    beta = 90. - delta
 
     gamma = np.deg2rad(gamma)
     beta = np.deg2rad(90. - delta)
@@ -209,12 +208,16 @@ def to_gamma(v):
     return np.rad2deg(gamma)
 
 
+# lookup table for numerically inverting u(beta) in `to_delta`; the table
+# does not depend on input arguments, so it is computed only once
+_beta0 = np.linspace(0, np.pi, 100)
+_u0 = 0.75*_beta0 - 0.5*np.sin(2.*_beta0) + 0.0625*np.sin(4.*_beta0)
+
+
 def to_delta(w):
     """ Converts from Tape2015 parameter w to lune latitude
     """
-    beta0 = np.linspace(0, np.pi, 100)
-    u0 = 0.75*beta0 - 0.5*np.sin(2.*beta0) + 0.0625*np.sin(4.*beta0)
-    beta = np.interp(3.*np.pi/8. - w, u0, beta0)
+    beta = np.interp(3.*np.pi/8. - w, _u0, _beta0)
     delta = np.rad2deg(np.pi/2. - beta)
     return delta
 
@@ -58,8 +58,8 @@ def resolve_model(name):
         raise ValueError('Bad model')
 
 
-def download_greens_tensor(url, model, station, origin):
-    """ Downloads Green's functions through syngine URL interface
+def get_greens_tensor_url(url, model, station, origin):
+    """ Returns syngine URL for Green's functions of given station and origin
     """
     distance_in_deg = get_distance_in_deg(station, origin)
 
@@ -72,6 +72,14 @@ def download_greens_tensor(url, model, station, origin):
          +'&origintime='+str(origin.time)[:-1]
          +'&starttime='+str(origin.time)[:-1])
 
+    return url
+
+
+def download_greens_tensor(url, model, station, origin):
+    """ Downloads Green's functions through syngine URL interface
+    """
+    url = get_greens_tensor_url(url, model, station, origin)
+
     try:
        dirname = os.environs['SYNGINE_DOWNLOADS']
     except:
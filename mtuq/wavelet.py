@@ -79,13 +79,21 @@ class Wavelet(object):
         return w
 
 
-    def _convolve_array(self, y, dt, mode=1):
+    def _convolve_array(self, y, dt, mode=1, _cache=None):
         """ Convolves NumPy array with given wavelet
         """
         nt = len(y)
-        half_duration = (nt-1)*dt/2.
-        w = self._evaluate_on_interval(half_duration, nt)
-        w *= dt
+
+        # callers convolving many traces in one go can supply a dict, so that
+        # the wavelet is discretized only once per time sampling
+        if _cache is not None and (nt, dt) in _cache:
+            w = _cache[(nt, dt)]
+        else:
+            half_duration = (nt-1)*dt/2.
+            w = self._evaluate_on_interval(half_duration, nt)
+            w *= dt
+            if _cache is not None:
+                _cache[(nt, dt)] = w
 
         if mode==1:
             # frequency-domain implementation
@@ -37,13 +37,13 @@ Docstring_GridSearch_DoubleCoupleMagnitudeDepth="""
 if __name__=='__main__':
     #
     # Carries out grid search over source orientation, magnitude, and depth
-    #   
+    #
     # USAGE
     #   mpirun -n <NPROC> python GridSearch.DoubleCouple+Magnitude+Depth.py
     #
     # This is the most complicated example. For a much simpler one, see
     # SerialGridSearch.DoubleCouple.py
-    #   
+    #
 
 """
 
@@ -425,7 +425,7 @@ OriginsDefinitions="""
 
     depths = np.array(
          # depth in meters
-        [25000, 30000, 35000, 40000,                    
+        [25000, 30000, 35000, 40000,
          45000, 50000, 55000, 60000])
 
     origins = []
@@ -459,8 +459,8 @@ Grid_DoubleCoupleMagnitudeDepth="""
 
     magnitudes = np.array(
          # moment magnitude (Mw)
-        [4.3, 4.4, 4.5,     
-         4.6, 4.7, 4.8]) 
+        [4.3, 4.4, 4.5,
+         4.6, 4.7, 4.8])
 
     grid = DoubleCoupleGridRegular(
         npts_per_axis=30,
@@ -591,11 +591,9 @@ Main_GridSearch_DoubleCouple="""
         greens_sw = None
 
 
-    stations = comm.bcast(stations, root=0)
-    data_bw = comm.bcast(data_bw, root=0)
-    data_sw = comm.bcast(data_sw, root=0)
-    greens_bw = comm.bcast(greens_bw, root=0)
-    greens_sw = comm.bcast(greens_sw, root=0)
+    # a single collective call rather than one per object
+    stations, data_bw, data_sw, greens_bw, greens_sw = comm.bcast(
+        (stations, data_bw, data_sw, greens_bw, greens_sw), root=0)
 
 
     #
@@ -639,10 +637,10 @@ Main_GridSearch_DoubleCoupleMagnitudeDepth="""
 
     if rank==0:
         print('Reading data...\\n')
-        data = read(path_data, format='sac', 
+        data = read(path_data, format='sac',
             event_id=event_id,
             station_id_list=station_id_list,
-            tags=['units:cm', 'type:velocity']) 
+            tags=['units:cm', 'type:velocity'])
 
 
         data.sort_by_distance()
@@ -672,11 +670,9 @@ Main_GridSearch_DoubleCoupleMagnitudeDepth="""
         greens_sw = None
 
 
-    stations = comm.bcast(stations, root=0)
-    data_bw = comm.bcast(data_bw, root=0)
-    data_sw = comm.bcast(data_sw, root=0)
-    greens_bw = comm.bcast(greens_bw, root=0)
-    greens_sw = comm.bcast(greens_sw, root=0)
+    # a single collective call rather than one per object
+    stations, data_bw, data_sw, greens_bw, greens_sw = comm.bcast(
+        (stations, data_bw, data_sw, greens_bw, greens_sw), root=0)
 
 
     #
@@ -967,12 +963,12 @@ WrapUp_GridSearch_DoubleCoupleMagnitudeDepth="""
         print('Saving results...\\n')
 
         plot_data_greens(event_id+'_waveforms.png',
-            [data_bw, data_sw], [greens_bw, greens_sw], 
-            [process_bw, process_sw], [misfit_bw, misfit_sw], 
+            [data_bw, data_sw], [greens_bw, greens_sw],
+            [process_bw, process_sw], [misfit_bw, misfit_sw],
             stations, best_origin, best_source, lune_dict)
 
         plot_misfit_depth(event_id+'_misfit_depth.png',
-            results, origins, grid, event_id)
+            results, origins, grid, title=event_id)
 
         print('\\nFinished\\n')
 """
@@ -1135,206 +1131,201 @@ Main_BenchmarkCAP="""
 
 if __name__=='__main__':
     import os
-    from mtuq.util import basepath, replace
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+    from mtuq.util import basepath
+    from mtuq.util import replace as _replace
     os.chdir(basepath())
 
+    # several fragments receive identical substitutions in more than one
+    # output file, so results are memoized
+    _replaced = {}
+    def replace(*args):
+        if args not in _replaced:
+            _replaced[args] = _replace(*args)
+        return _replaced[args]
+
+    # variants shared by all tests that read Green's functions from the
+    # FK database, rather than downloading them
+    DataProcessingDefinitions_FK = replace(
+        DataProcessingDefinitions,
+        'pick_type=.*',
+        "pick_type='FK_metadata',",
+        'taup_model=.*,',
+        'FK_database=path_greens,',
+        )
+
+    # the line being swapped out is plain text, so no regex is needed
+    Main1_SerialGridSearch_DoubleCouple_FK = \
+        Main1_SerialGridSearch_DoubleCouple.replace(
+        'greens = download_greens_tensors(stations, origin, model)',
+        'db = open_db(path_greens, format=\'FK\', model=model)\n    '
+       +'greens = db.get_greens_tensors(stations, origin)',
+        )
 
-    with open('examples/GridSearch.DoubleCouple.py', 'w') as file:
-        file.write("#!/usr/bin/env python\n")
-        file.write(Imports)
-        file.write(Docstring_GridSearch_DoubleCouple)
-        file.write(PathsComments)
-        file.write(Paths_Syngine)
-        file.write(DataProcessingComments)
-        file.write(DataProcessingDefinitions)
-        file.write(MisfitComments)
-        file.write(MisfitDefinitions)
-        file.write(WeightsComments)
-        file.write(WeightsDefinitions)
-        file.write(Grid_DoubleCouple)
-        file.write(OriginComments)
-        file.write(OriginDefinitions)
-        file.write(Main_GridSearch_DoubleCouple)
-        file.write(WrapUp_GridSearch_DoubleCouple)
-
-
-    with open('examples/GridSearch.DoubleCouple+Magnitude+Depth.py', 'w') as file:
-        file.write("#!/usr/bin/env python\n")
-        file.write(
-            replace(
+    outputs = []
+
+    outputs += [('examples/GridSearch.DoubleCouple.py', [
+        "#!/usr/bin/env python\n",
+        Imports,
+        Docstring_GridSearch_DoubleCouple,
+        PathsComments,
+        Paths_Syngine,
+        DataProcessingComments,
+        DataProcessingDefinitions,
+        MisfitComments,
+        MisfitDefinitions,
+        WeightsComments,
+        WeightsDefinitions,
+        Grid_DoubleCouple,
+        OriginComments,
+        OriginDefinitions,
+        Main_GridSearch_DoubleCouple,
+        WrapUp_GridSearch_DoubleCouple,
+        ])]
+
+
+    outputs += [('examples/GridSearch.DoubleCouple+Magnitude+Depth.py', [
+        "#!/usr/bin/env python\n",
+        replace(
             Imports,
             'plot_beachball',
             'plot_misfit_depth',
-            ))
-        file.write(Docstring_GridSearch_DoubleCoupleMagnitudeDepth)
-        file.write(PathsComments)
-        file.write(Paths_Syngine)
-        file.write(DataProcessingComments)
-        file.write(DataProcessingDefinitions)
-        file.write(MisfitComments)
-        file.write(MisfitDefinitions)
-        file.write(WeightsComments)
-        file.write(WeightsDefinitions)
-        file.write(OriginsComments)
-        file.write(OriginsDefinitions)
-        file.write(Grid_DoubleCoupleMagnitudeDepth)
-        file.write(Main_GridSearch_DoubleCoupleMagnitudeDepth)
-        file.write(WrapUp_GridSearch_DoubleCoupleMagnitudeDepth)
-
-
-    with open('examples/GridSearch.FullMomentTensor.py', 'w') as file:
-        file.write("#!/usr/bin/env python\n")
-        file.write(
-            replace(
+            ),
+        Docstring_GridSearch_DoubleCoupleMagnitudeDepth,
+        PathsComments,
+        Paths_Syngine,
+        DataProcessingComments,
+        DataProcessingDefinitions,
+        MisfitComments,
+        MisfitDefinitions,
+        WeightsComments,
+        WeightsDefinitions,
+        OriginsComments,
+        OriginsDefinitions,
+        Grid_DoubleCoupleMagnitudeDepth,
+        Main_GridSearch_DoubleCoupleMagnitudeDepth,
+        WrapUp_GridSearch_DoubleCoupleMagnitudeDepth,
+        ])]
+
+
+    outputs += [('examples/GridSearch.FullMomentTensor.py', [
+        "#!/usr/bin/env python\n",
+        replace(
             Imports,
             'DoubleCoupleGridRegular',
             'FullMomentTensorGridSemiregular',
             'plot_misfit_dc',
             'plot_misfit_lune',
-            ))
-        file.write(Docstring_GridSearch_FullMomentTensor)
-        file.write(Paths_Syngine)
-        file.write(DataProcessingComments)
-        file.write(DataProcessingDefinitions)
-        file.write(MisfitComments)
-        file.write(MisfitDefinitions)
-        file.write(WeightsComments)
-        file.write(WeightsDefinitions)
-        file.write(Grid_FullMomentTensor)
-        file.write(OriginComments)
-        file.write(OriginDefinitions)
-        file.write(Main_GridSearch_DoubleCouple)
-        file.write(
-            replace(
+            ),
+        Docstring_GridSearch_FullMomentTensor,
+        Paths_Syngine,
+        DataProcessingComments,
+        DataProcessingDefinitions,
+        MisfitComments,
+        MisfitDefinitions,
+        WeightsComments,
+        WeightsDefinitions,
+        Grid_FullMomentTensor,
+        OriginComments,
+        OriginDefinitions,
+        Main_GridSearch_DoubleCouple,
+        replace(
             WrapUp_GridSearch_DoubleCouple,
             'DC',
             'FMT',
             'plot_misfit_dc',
             'plot_misfit_lune',
-            ))
-
-
-    with open('examples/SerialGridSearch.DoubleCouple.py', 'w') as file:
-        file.write("#!/usr/bin/env python\n")
-        file.write(Imports)
-        file.write(Docstring_SerialGridSearch_DoubleCouple)
-        file.write(PathsComments)
-        file.write(Paths_Syngine)
-        file.write(DataProcessingComments)
-        file.write(DataProcessingDefinitions)
-        file.write(MisfitComments)
-        file.write(MisfitDefinitions)
-        file.write(WeightsComments)
-        file.write(WeightsDefinitions)
-        file.write(Grid_DoubleCouple)
-        file.write(OriginComments)
-        file.write(OriginDefinitions)
-        file.write(Main1_SerialGridSearch_DoubleCouple)
-        file.write(Main2_SerialGridSearch_DoubleCouple)
-        file.write(WrapUp_SerialGridSearch_DoubleCouple)
-
-
-    with open('tests/test_grid_search_mt.py', 'w') as file:
-        file.write(Imports)
-        file.write(Docstring_TestGridSearch_DoubleCouple)
-        file.write(ArgparseDefinitions)
-        file.write(Paths_FK)
-        file.write(
-            replace(
-            DataProcessingDefinitions,
-            'pick_type=.*',
-            "pick_type='FK_metadata',",
-            'taup_model=.*,',
-            'FK_database=path_greens,',
-            ))
-        file.write(MisfitDefinitions)
-        file.write(
-            replace(
+            ),
+        ])]
+
+
+    outputs += [('examples/SerialGridSearch.DoubleCouple.py', [
+        "#!/usr/bin/env python\n",
+        Imports,
+        Docstring_SerialGridSearch_DoubleCouple,
+        PathsComments,
+        Paths_Syngine,
+        DataProcessingComments,
+        DataProcessingDefinitions,
+        MisfitComments,
+        MisfitDefinitions,
+        WeightsComments,
+        WeightsDefinitions,
+        Grid_DoubleCouple,
+        OriginComments,
+        OriginDefinitions,
+        Main1_SerialGridSearch_DoubleCouple,
+        Main2_SerialGridSearch_DoubleCouple,
+        WrapUp_SerialGridSearch_DoubleCouple,
+        ])]
+
+
+    outputs += [('tests/test_grid_search_mt.py', [
+        Imports,
+        Docstring_TestGridSearch_DoubleCouple,
+        ArgparseDefinitions,
+        Paths_FK,
+        DataProcessingDefinitions_FK,
+        MisfitDefinitions,
+        replace(
             Grid_DoubleCouple,
             'npts.*,',
             'npts_per_axis=5,',
-            ))
-        file.write(WeightsDefinitions)
-        file.write(OriginDefinitions)
-        file.write(
-            replace(
-            Main1_SerialGridSearch_DoubleCouple,
-            'greens = download_greens_tensors\(stations, origin, model\)',
-            'db = open_db(path_greens, format=\'FK\', model=model)\n    '
-           +'greens = db.get_greens_tensors(stations, origin)',
-            ))
-        file.write(
-            replace(
+            ),
+        WeightsDefinitions,
+        OriginDefinitions,
+        Main1_SerialGridSearch_DoubleCouple_FK,
+        replace(
             Main2_SerialGridSearch_DoubleCouple,
             'origin, grid',
             'origin, grid, 0',
-            ))
-        file.write(WrapUp_TestGridSearch_DoubleCouple)
+            ),
+        WrapUp_TestGridSearch_DoubleCouple,
+        ])]
 
 
-    with open('tests/test_grid_search_mt_depth.py', 'w') as file:
-        file.write(
-            replace(
+    outputs += [('tests/test_grid_search_mt_depth.py', [
+        replace(
             Imports,
             'plot_beachball',
             'plot_misfit_depth',
-            ))
-        file.write(Docstring_TestGridSearch_DoubleCoupleMagnitudeDepth)
-        file.write(ArgparseDefinitions)
-        file.write(Paths_FK)
-        file.write(
-            replace(
-            DataProcessingDefinitions,
-            'pick_type=.*',
-            "pick_type='FK_metadata',",
-            'taup_model=.*,',
-            'FK_database=path_greens,',
-            ))
-        file.write(MisfitDefinitions)
-        file.write(WeightsDefinitions)
-        file.write(Grid_TestDoubleCoupleMagnitudeDepth)
-        file.write(Main_TestGridSearch_DoubleCoupleMagnitudeDepth)
-        file.write(WrapUp_TestGridSearch_DoubleCoupleMagnitudeDepth)
-
-
-    with open('tests/test_misfit.py', 'w') as file:
-        file.write(
-            replace(
+            ),
+        Docstring_TestGridSearch_DoubleCoupleMagnitudeDepth,
+        ArgparseDefinitions,
+        Paths_FK,
+        DataProcessingDefinitions_FK,
+        MisfitDefinitions,
+        WeightsDefinitions,
+        Grid_TestDoubleCoupleMagnitudeDepth,
+        Main_TestGridSearch_DoubleCoupleMagnitudeDepth,
+        WrapUp_TestGridSearch_DoubleCoupleMagnitudeDepth,
+        ])]
+
+
+    outputs += [('tests/test_misfit.py', [
+        replace(
             Imports,
-            ))
-        file.write(Docstring_TestMisfit)
-        file.write(Paths_FK)
-        file.write(
-            replace(
-            DataProcessingDefinitions,
-            'pick_type=.*',
-            "pick_type='FK_metadata',",
-            'taup_model=.*,',
-            'FK_database=path_greens,',
-            ))
-        file.write(MisfitDefinitions)
-        file.write(WeightsComments)
-        file.write(WeightsDefinitions)
-        file.write(
-            replace(
+            ),
+        Docstring_TestMisfit,
+        Paths_FK,
+        DataProcessingDefinitions_FK,
+        MisfitDefinitions,
+        WeightsComments,
+        WeightsDefinitions,
+        replace(
             Grid_DoubleCouple,
             'npts.*,',
             'npts_per_axis=5,',
-            ))
-        file.write(OriginDefinitions)
-        file.write(
-            replace(
-            Main1_SerialGridSearch_DoubleCouple,
-            'greens = download_greens_tensors\(stations, origin, model\)',
-            'db = open_db(path_greens, format=\'FK\', model=model)\n    '
-           +'greens = db.get_greens_tensors(stations, origin)',
-            ))
-        file.write(Main_TestMisfit)
+            ),
+        OriginDefinitions,
+        Main1_SerialGridSearch_DoubleCouple_FK,
+        Main_TestMisfit,
+        ])]
 
 
-    with open('tests/benchmark_cap_vs_mtuq.py', 'w') as file:
-        file.write(
-            replace(
+    outputs += [('tests/benchmark_cap_vs_mtuq.py', [
+        replace(
             Imports,
             'Origin',
             'MomentTensor',
@@ -1342,68 +1333,76 @@ if __name__=='__main__':
             'fk',
             'plot_data_greens',
             'plot_waveforms2',
-            ))
-        file.write(Docstring_BenchmarkCAP)
-        file.write(ArgparseDefinitions)
-        file.write(Paths_BenchmarkCAP)
-        file.write(
-            replace(
+            ),
+        Docstring_BenchmarkCAP,
+        ArgparseDefinitions,
+        Paths_BenchmarkCAP,
+        replace(
             Paths_FK,
             'data/examples/20090407201255351/weights.dat',
             'data/tests/benchmark_cap/20090407201255351/weights.dat',
-            ))
-        file.write(
-            replace(
-            DataProcessingDefinitions,
-            'pick_type=.*',
-            "pick_type='FK_metadata',",
-            'taup_model=.*,',
-            'FK_database=path_greens,',
-            ))
-        file.write(
-            replace(
+            ),
+        DataProcessingDefinitions_FK,
+        replace(
             MisfitDefinitions,
             'time_shift_max=.*',
             'time_shift_max=0.,',
-            ))
-        file.write(Grid_BenchmarkCAP)
-        file.write(Main_BenchmarkCAP)
-
-
-    with open('tests/test_graphics.py', 'w') as file:
-        file.write(Imports)
-        file.write(Docstring_TestGraphics)
-        file.write(Paths_FK)
-        file.write(
-            replace(
-            DataProcessingDefinitions,
-            'pick_type=.*',
-            "pick_type='FK_metadata',",
-            'taup_model=.*,',
-            'FK_database=path_greens,',
-            ))
-        file.write(MisfitDefinitions)
-        file.write(Grid_TestGraphics)
-        file.write(Main_TestGraphics)
-
-
-    with open('mtuq/util/gallery.py', 'w') as file:
-        file.write(Imports)
-        file.write(Docstring_Gallery)
-        file.write(Paths_Syngine)
-        file.write(DataProcessingDefinitions)
-        file.write(MisfitDefinitions)
-        file.write(
-            replace(
+            ),
+        Grid_BenchmarkCAP,
+        Main_BenchmarkCAP,
+        ])]
+
+
+    outputs += [('tests/test_graphics.py', [
+        Imports,
+        Docstring_TestGraphics,
+        Paths_FK,
+        DataProcessingDefinitions_FK,
+        MisfitDefinitions,
+        Grid_TestGraphics,
+        Main_TestGraphics,
+        ])]
+
+
+    outputs += [('mtuq/util/gallery.py', [
+        Imports,
+        Docstring_Gallery,
+        Paths_Syngine,
+        DataProcessingDefinitions,
+        MisfitDefinitions,
+        replace(
             Grid_DoubleCouple,
             'npts.*',
             'npts_per_axis=10,',
-            ))
-        file.write(
-            replace(
+            ),
+        replace(
             Main1_SerialGridSearch_DoubleCouple,
             'print.*',
             '',
-            ))
-
+            ),
+        ])]
+
+
+    def write(filename, parts):
+        text = ''.join(parts)
+
+        # leave up-to-date files untouched, so that their timestamps are
+        # preserved
+        if os.path.exists(filename):
+            with open(filename) as file:
+                if file.read()==text:
+                    return
+
+        # write to a temporary file and rename, so that readers never see a
+        # partially written file; permissions of the old file are kept
+        with open(filename+'.tmp', 'w') as file:
+            file.write(text)
+        if os.path.exists(filename):
+            shutil.copymode(filename, filename+'.tmp')
+        os.replace(filename+'.tmp', filename)
+
+    # output files do not depend on one another, so can be written
+    # concurrently
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        list(executor.map(lambda args: write(*args), outputs))
 
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+
+import copy
+import pickle
+import unittest
+
+from mtuq.util import AttribDict
+
+
+class TestAttribDict(unittest.TestCase):
+
+    def test_attributes(self):
+        header = AttribDict()
+        header.npts = 1001
+        assert header.npts == 1001
+        assert header['npts'] == 1001
+
+        del header.npts
+        assert 'npts' not in header
+        assert not hasattr(header, 'npts')
+
+        with self.assertRaises(AttributeError):
+            del header.npts
+
+
+    def test_copy(self):
+        header = AttribDict(channel='Z', tags=['units:cm'])
+
+        for header_copy in [header.copy(), copy.deepcopy(header)]:
+            assert type(header_copy) is AttribDict
+            assert header_copy.channel == 'Z'
+
+            # copies are deep, so nested items are not shared
+            header_copy.tags.append('type:velocity')
+            assert header.tags == ['units:cm']
+
+
+    def test_pickle(self):
+        header = AttribDict(channel='Z', weight=1.)
+        header_copy = pickle.loads(pickle.dumps(header))
+        assert type(header_copy) is AttribDict
+        assert header_copy == header
+        assert header_copy.weight == 1.
+
+
+
+if __name__ == '__main__':
+    unittest.main()
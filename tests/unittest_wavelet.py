@@ -4,6 +4,11 @@
 import unittest
 import numpy as np
 
+from copy import deepcopy
+from obspy.core import Trace
+from mtuq.event import Origin
+from mtuq.greens_tensor.base import GreensTensor, GreensTensorList
+from mtuq.station import Station
 from mtuq.wavelet import\
     Gaussian,\
     Triangle,\
@@ -13,6 +18,19 @@ from mtuq.wavelet import\
 
 EPSVAL = 1.e-3
 
+def _get_greens_tensors(nt=1001, dt=0.01):
+    station = Station({'latitude': 0., 'longitude': 1.})
+    origin = Origin({'latitude': 0., 'longitude': 0., 'depth_in_m': 0.})
+
+    tensors = []
+    for _i in range(2):
+        traces = [Trace(np.random.rand(nt), header={'delta': dt})
+            for _ in range(3)]
+        tensors += [GreensTensor(traces, station=station, origin=origin,
+            id='XX.TEST%d' % _i)]
+    return GreensTensorList(tensors)
+
+
 def _is_close(a, b):
     if abs(a-b) < EPSVAL:
         return True
@@ -51,6 +69,58 @@ class TestWavelets(unittest.TestCase):
         assert _is_close( dt*np.sum(w), 1. )
 
 
+    def test_convolution_after_modification(self):
+        # a wavelet modified after a convolution must not reuse the previously
+        # discretized wavelet
+        y = np.zeros(1001)
+        y[500] = 1.
+        dt = 0.01
+
+        wavelet = Triangle(half_duration=1.)
+        w1 = wavelet._convolve_array(y, dt)
+
+        wavelet.half_duration = 3.
+        w2 = wavelet._convolve_array(y, dt)
+
+        w3 = Triangle(half_duration=3.)._convolve_array(y, dt)
+        assert not np.allclose(w1, w2)
+        assert np.allclose(w2, w3)
+
+
+    def test_convolution_GreensTensorList(self):
+        # convolving a GreensTensorList, which discretizes the wavelet only
+        # once, must give the same traces as convolving trace by trace
+        wavelet = Trapezoid(half_duration=1., rise_time=0.5)
+
+        greens = _get_greens_tensors()
+        expected = deepcopy(greens)
+
+        greens.convolve(wavelet)
+        for tensor in expected:
+            for trace in tensor:
+                wavelet.convolve(trace)
+
+        for tensor1, tensor2 in zip(greens, expected):
+            for trace1, trace2 in zip(tensor1, tensor2):
+                assert np.allclose(trace1.data, trace2.data)
+
+
+    def test_convolution_user_defined(self):
+        # objects that only provide convolve(trace) are still supported
+        class Scale(object):
+            def convolve(self, trace):
+                trace.data *= 2.
+                return trace
+
+        greens = _get_greens_tensors()
+        expected = deepcopy(greens)
+
+        greens.convolve(Scale())
+        for tensor1, tensor2 in zip(greens, expected):
+            for trace1, trace2 in zip(tensor1, tensor2):
+                assert np.allclose(trace1.data, 2.*trace2.data)
+
+
 
 if __name__ == '__main__':
     unittest.main()